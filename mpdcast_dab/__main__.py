@@ -20,6 +20,7 @@
 from __future__ import annotations
 import sys
 import signal
+import socket
 import asyncio
 import argparse
 import logging
@@ -27,6 +28,11 @@ import types
 from typing import Any
 import ifaddr
 from aiohttp import web
+uvloop: types.ModuleType | None
+try:
+  import uvloop
+except ImportError:
+  uvloop = None
 
 from mpdcast_dab.dabserver.output_grabber import RedirectedStreams
 from mpdcast_dab.mpdcast.mpd_caster import MpdCaster
@@ -38,26 +44,49 @@ except (ModuleNotFoundError, ImportError, AttributeError) as error:
 
 logger = logging.getLogger(__name__)
 
-def get_first_ipv4_address() -> str | None:
+_EXTERNAL_LOGGERS = ('aiohttp', 'pychromecast', 'zeroconf', 'Welle.io')
+
+def _is_usable_ipv4_address(ip_string: str) -> bool:
+  # Filter out link-local and loopback addresses.
+  return not ip_string.startswith(('169.254.', '127.'))
+
+def _get_first_adapter_ipv4_address() -> str | None:
   for iface in ifaddr.get_adapters():
     for addr in iface.ips:
-      # Filter out link-local addresses.
       if addr.is_IPv4:
         ip_string = str(addr.ip)
-        if not (ip_string.startswith('169.254.') or ip_string == '127.0.0.1'):
+        if _is_usable_ipv4_address(ip_string):
           return ip_string
   return None
 
+def get_first_ipv4_address() -> str | None:
+  # Let the kernel select the source address for an outgoing route.
+  # Connecting a UDP socket does not send any packet.
+  try:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+      sock.settimeout(0)
+      sock.connect(('10.255.255.255', 1))
+      ip_string: str = sock.getsockname()[0]
+    if _is_usable_ipv4_address(ip_string):
+      return ip_string
+  except OSError:
+    pass
+  # no route available. Fall back to enumerating all adapters
+  return _get_first_adapter_ipv4_address()
+
 def update_logger_config(verbose: bool) -> None:
   internal_log_level = logging.INFO    if verbose else logging.WARNING
   external_log_level = logging.WARNING if verbose else logging.ERROR
-  logging.basicConfig(format='%(name)s - %(levelname)s: %(message)s',
-                      encoding='utf-8', level=internal_log_level,
-                      stream=sys.stdout, force=True)
-  logging.getLogger('aiohttp').setLevel(external_log_level)
-  logging.getLogger('pychromecast').setLevel(external_log_level)
-  logging.getLogger('zeroconf').setLevel(external_log_level)
-  logging.getLogger('Welle.io').setLevel(external_log_level)
+  root_logger = logging.getLogger()
+  if root_logger.handlers:
+    # handlers are in place already. Only update the level
+    root_logger.setLevel(internal_log_level)
+  else:
+    logging.basicConfig(format='%(name)s - %(levelname)s: %(message)s',
+                        encoding='utf-8', level=internal_log_level,
+                        stream=sys.stdout, force=True)
+  for logger_name in _EXTERNAL_LOGGERS:
+    logging.getLogger(logger_name).setLevel(external_log_level)
   logging.getLogger(__name__).setLevel(logging.INFO)
 
 def get_args() -> dict[str, Any]:
@@ -114,12 +143,16 @@ def main(run_from_local: bool = False) -> None:
   options = get_args()
 
   redirectors = RedirectedStreams('Welle.io')
-  if not options['disable_dabserver']:
+  redirect_streams = not options['disable_dabserver']
+  if redirect_streams:
     redirectors.redirect_out_streams()
   update_logger_config(options['verbose'])
 
-  loop = asyncio.new_event_loop()
+  # prefer the libuv based event loop, if available
+  loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
   asyncio.set_event_loop(loop)
+  if redirect_streams:
+    redirectors.attach_to_loop(loop)
   web_app = web.Application()
   prefix = 'src' if run_from_local else '/usr/share/mpdcast-dab'
   mpd_caster = prepare_cast(options, web_app, prefix)
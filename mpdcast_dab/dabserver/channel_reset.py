@@ -0,0 +1,30 @@
+# Copyright (C) 2024 Lamarqe
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License
+# as published by the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Channel reset of the DAB device without blocking the event loop."""
+
+import asyncio
+
+from .welle_io import DabDevice
+
+async def reset_channel(device: DabDevice) -> None:
+  # Resetting the channel joins the DAB threads. Run it in an executor, so the event loop
+  # keeps draining the redirected output of these threads in the meantime.
+  reset = asyncio.get_running_loop().run_in_executor(None, device.reset_channel)
+  try:
+    await asyncio.shield(reset)
+  except asyncio.CancelledError:
+    # The reset cannot be interrupted. Let it finish before passing on the cancellation
+    await reset
+    raise
@@ -14,52 +14,94 @@
 
 """Empty callback handlers for DAB+ data and events"""
 
+import collections
+import typing
+
+def _empty_handler(method: typing.Callable) -> typing.Callable:
+  # the DAB library does not forward callbacks to handlers marked this way
+  method.skip_forwarding = True  # type: ignore[attr-defined]
+  return method
+
 class ServiceEventPass():
+  @_empty_handler
   async def on_frame_errors(self, frame_errors: int) -> None:
     pass
 
-  async def on_new_audio(self, audio_data: bytes, sample_rate: int, mode: str) -> None:
+  @_empty_handler
+  async def on_new_audio(self, audio_data: memoryview, sample_rate: int, mode: str) -> None:
     pass
 
+  async def on_new_audio_frames(self, audio_frames: collections.deque) -> None:
+    # Audio frames get delivered in batches. Forward them one by one, by default.
+    # A frame is only removed after processing. While the queue is not empty,
+    # no further batch gets submitted, which keeps the frames in order.
+    try:
+      while audio_frames:
+        try:
+          await self.on_new_audio(*audio_frames[0])
+        finally:
+          audio_frames.popleft()
+    except BaseException:
+      # The drain ends here. Drop the remaining frames as well,
+      # so the next frame submits a new batch instead of stalling the queue.
+      audio_frames.clear()
+      raise
+
+  @_empty_handler
   async def on_rs_errors(self, uncorrected_errors: int, num_corrected_errors: int) -> None:
     pass
 
+  @_empty_handler
   async def on_aac_errors(self, aac_errors: int) -> None:
     pass
 
+  @_empty_handler
   async def on_new_dynamic_label(self, label: str) -> None:
     pass
 
+  @_empty_handler
   async def on_mot(self, data: bytes, mime_type: str, name: str) -> None:
     pass
 
 class ChannelEventPass():
+  @_empty_handler
   async def on_snr(self, snr: float) -> None:
     pass
 
+  @_empty_handler
   async def on_frequency_corrector_change(self, fine: int, coarse: int) -> None:
     pass
 
+  @_empty_handler
   async def on_sync_change(self, is_sync: bool) -> None:
     pass
 
+  @_empty_handler
   async def on_signal_presence(self, is_signal: bool) -> None:
     pass
 
+  @_empty_handler
   async def on_service_detected(self, service_id: int) -> None:
     pass
 
+  @_empty_handler
   async def on_new_ensemble(self, ensemble_id: int) -> None:
     pass
 
-  async def on_set_ensemble_label(self, label: str) -> None:
+  # Plain (non-async) handlers are called directly on the DAB thread instead of the event loop.
+  # They must neither touch asyncio objects nor call the DAB device.
+  @_empty_handler
+  def on_set_ensemble_label(self, label: str) -> None:
     pass
 
+  @_empty_handler
   async def on_datetime_update(self, timestamp: int) -> None:
     pass
 
+  @_empty_handler
   async def on_fib_decode_success(self, crc_check_ok: int, fib: int) -> None:
     pass
 
+  @_empty_handler
   async def on_message(self, text: str, text2: str, is_error: bool) -> None:
     pass
@@ -22,6 +22,7 @@ import yarl
 
 from .welle_io import DabDevice, ChannelEventHandler, all_channel_names
 from .dab_callbacks import ChannelEventPass
+from .channel_reset import reset_channel
 
 logger = logging.getLogger(__name__)
 
@@ -118,9 +119,9 @@ class DabScanner(ChannelEventHandler, ChannelEventPass):
             self.scan_results[channel][service_id]['name'] = name
             service_count+= 1
 
-        self._dab_device.reset_channel()
+        await reset_channel(self._dab_device)
     except asyncio.CancelledError:
-      self._dab_device.reset_channel()
+      await reset_channel(self._dab_device)
       self.ui_status['scanner_status'] = 'Scan stopped. Found ' + str(service_count) + ' radio services.'
       raise
     finally:
@@ -23,6 +23,7 @@ from aiohttp import web
 from .radio_controller import RadioController
 from .dab_scanner import DabScanner
 from .service_controller import UnsubscribedError
+from .channel_reset import reset_channel
 from .welle_io import DabDevice
 
 logger = logging.getLogger(__name__)
@@ -85,9 +86,9 @@ class DabServer():
 
   async def stop(self) -> None:
     self._shutdown_in_progress = True
-    self._radio_controller().stop()
+    await self._radio_controller().stop()
     await self._scanner().stop()
-    self._dab_device.reset_channel()
+    await reset_channel(self._dab_device)
     self._dab_device.close_device()
 
   # is_float should only be true if the audio data is in 32-bit floating-point format.
@@ -14,67 +14,89 @@
 
 """This module is used to redirect stdout/stderr streams to a python logger."""
 
+import asyncio
 import io
 import os
 import sys
-import threading
 import logging
 import typing
 
 class OutputGrabber:
-  _ESC_CHAR = b'\b'
+  _READ_SIZE  = 4096
+  _LOG_LEVELS = {logging.Logger.error:   logging.ERROR,
+                 logging.Logger.warning: logging.WARNING}
 
   def __init__(self, stream: typing.TextIO, log_name: str, log_method: typing.Callable) -> None:
     self._logger = logging.getLogger(log_name)
     self._pipe_out, self._pipe_in = os.pipe()
-    self._logger_thread: threading.Thread | None = None
-    self._log_method = log_method
+    # the pipe gets read from the event loop, which must never block
+    os.set_blocking(self._pipe_out, False)
+    self._captured_stream: bytearray                        = bytearray()
+    self._is_redirected:   bool                             = False
+    self._loop:            asyncio.AbstractEventLoop | None = None
+    # bind the log method to our logger once, instead of resolving it for every line
+    self._log_level:  int             = self._LOG_LEVELS[log_method]
+    self._log_method: typing.Callable = getattr(self._logger, log_method.__name__)
 
     # store the original stream
     self._orig_stream = stream
     # replicate the original stream using a new FD
     self._replica_stream = os.fdopen(os.dup(self._orig_stream.fileno()), 'w')
 
-  def _log_pipe(self) -> None:
-    captured_stream = ''
-    while True:
-      char = os.read(self._pipe_out, 1)
-      if char == self._ESC_CHAR:
-        break
-      data = char.decode()
-      if data == '\n':
-        self._log_method(self._logger, captured_stream)
-        captured_stream = ''
-      else:
-        captured_stream += data
+  def _drain(self) -> bool:
+    # read the available data and log all complete lines. Returns False if the pipe is empty.
+    try:
+      chunk = os.read(self._pipe_out, self._READ_SIZE)
+    except BlockingIOError:
+      return False
+    self._captured_stream += chunk
+    line_end = self._captured_stream.find(b'\n')
+    while line_end >= 0:
+      # skip decoding completely if the line would get suppressed anyway
+      if self._logger.isEnabledFor(self._log_level):
+        self._log_method(self._captured_stream[:line_end].decode('utf-8', 'replace'))
+      del self._captured_stream[:line_end + 1]
+      line_end = self._captured_stream.find(b'\n')
+    return bool(chunk)
 
   def redirect_stream(self) -> io.TextIOWrapper:
-    if self._logger_thread:
+    if self._is_redirected:
       raise ValueError('stream is already redirected')
 
-    self._logger_thread = threading.Thread(target=self._log_pipe)
-    self._logger_thread.start()
+    # Until the stream is attached to an event loop, the output remains buffered in the pipe
+    self._is_redirected = True
     # make the pipe input available under the original FD, for C code
     os.dup2(self._pipe_in, self._orig_stream.fileno())
     # return the replicated stream for use in python code
     return self._replica_stream
 
+  def attach_to_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+    if not self._is_redirected:
+      raise ValueError('stream not redirected')
+
+    self._loop = loop
+    self._loop.add_reader(self._pipe_out, self._drain)
+
   def restore_stream(self) -> typing.TextIO:
-    if not self._logger_thread:
+    if not self._is_redirected:
       raise ValueError('stream not redirected')
 
-    # Print the escape character to make the readOutput method stop:
-    self._orig_stream.buffer.write(self._ESC_CHAR)
+    if self._loop:
+      self._loop.remove_reader(self._pipe_out)
+      self._loop = None
+    # log everything which is still left in the pipe
     self._orig_stream.flush()
-    self._logger_thread.join()
-    self._logger_thread = None
+    while self._drain():
+      pass
+    self._captured_stream.clear()
+    self._is_redirected = False
     # make the replicated stream available again under the original FD, for C code
     os.dup2(self._replica_stream.fileno(), self._orig_stream.fileno())
     # return the original stream for use in python code
     return self._orig_stream
 
   def cleanup(self) -> None:
-    if self._logger_thread:
+    if self._is_redirected:
       self.restore_stream()
 
 class RedirectedStreams():
@@ -86,6 +108,10 @@ class RedirectedStreams():
     sys.stdout = self._stdout_grabber.redirect_stream()
     sys.stderr = self._stderr_grabber.redirect_stream()
 
+  def attach_to_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+    self._stdout_grabber.attach_to_loop(loop)
+    self._stderr_grabber.attach_to_loop(loop)
+
   def restore_out_streams(self) -> None:
     self._stdout_grabber.cleanup()
     self._stderr_grabber.cleanup()
@@ -20,6 +20,7 @@ import dataclasses
 
 from .service_controller import ServiceController
 from .dab_callbacks import ChannelEventPass
+from .channel_reset import reset_channel
 from .welle_io import DabDevice, ChannelEventHandler
 
 logger = logging.getLogger(__name__)
@@ -36,67 +37,93 @@ class RadioController(ChannelEventHandler, ChannelEventPass):
     name:               str = ''
     ensemble_label:     str | None = None
 
-  SERVICE_DISCOVERY_TIMEOUT = 10
-  CHANNEL_RESET_DELAY       = 5
+  SERVICE_DISCOVERY_TIMEOUT  = 10
+  SERVICE_NAME_POLL_INTERVAL = 0.5
+  CHANNEL_RESET_DELAY        = 5
 
   def __init__(self, device: DabDevice) -> None:
     ChannelEventHandler.__init__(self)
     self._dab_device:         DabDevice                          = device
     self._services:           dict[int, RadioController.Service] = {}
+    # reverse index of all services whose name is already known
+    self._service_ids:        dict[str, int]                     = {}
+    # subscription requests waiting for their service to appear in the channel
+    self._pending_services:   dict[str, asyncio.Event]           = {}
     self._channel:            RadioController.ChannelData        = self.ChannelData()
-    self._channel_reset_task: asyncio.Task | None                = None
+    self._channel_reset:      asyncio.TimerHandle | None         = None
+    # strong reference to the running delayed reset
+    self._reset_task:         asyncio.Task | None                = None
+    # number of services which have a controller assigned
+    self._active_controllers: int                                = 0
     # lock to prevent parallel initialization from concurrent requests
     self._subscription_lock:  asyncio.Lock                       = asyncio.Lock()
 
   async def on_service_detected(self, service_id: int) -> None:
     if not service_id in self._services:
       self._services[service_id] = self.Service()
+    # wake up the waiting subscriptions whose service is known now
+    for service_name, detected_event in self._pending_services.items():
+      if self._fill_service_id(service_name):
+        detected_event.set()
 
-  async def on_set_ensemble_label(self, label: str) -> None:
+  def on_set_ensemble_label(self, label: str) -> None:
+    # called on the DAB thread. A single assignment does not need a hop to the event loop
     self._channel.ensemble_label = label
 
   def _fill_service_id(self, lookup_name: str) -> int | None:
-    for service_id, service in self._services.items():
-      if not service.name or len(service.name) == 0:
-        service.name = self._dab_device.get_service_name(service_id).rstrip()
-      if service.name == lookup_name:
-        return service_id
-    # Not found
-    return None
+    if lookup_name not in self._service_ids:
+      # only query the names of services which are still unnamed
+      for service_id, service in self._services.items():
+        if not service.name:
+          service.name = self._dab_device.get_service_name(service_id).rstrip()
+          if service.name:
+            self._service_ids[service.name] = service_id
+    # None if not found
+    return self._service_ids.get(lookup_name)
 
-  async def _wait_for_channel(self, service_name: str) -> int | None:
-    # initial check, as we might already have an active subscription for the service
-    service_id = self._fill_service_id(service_name)
-    if service_id:
-      return service_id
-
-    # wait the defined time for the service discovery
-    # and check every 0.5 seconds if it was succesful
-    for _ in range(2 * RadioController.SERVICE_DISCOVERY_TIMEOUT):
-      await asyncio.sleep(0.5)
+  async def _wait_for_service(self, service_name: str, detected_event: asyncio.Event) -> int:
+    while True:
+      # initial check, as we might already have an active subscription for the service
       service_id = self._fill_service_id(service_name)
       if service_id:
         return service_id
-    # Not found
-    return None
+      # The service label is decoded after the service got detected, without separate notification.
+      # So besides waking up on detection, we also need to recheck periodically.
+      try:
+        async with asyncio.timeout(RadioController.SERVICE_NAME_POLL_INTERVAL):
+          await detected_event.wait()
+      except TimeoutError:
+        pass
+
+  async def _wait_for_channel(self, service_name: str) -> int | None:
+    detected_event = self._pending_services.setdefault(service_name, asyncio.Event())
+    try:
+      # wait the defined time for the service discovery
+      async with asyncio.timeout(RadioController.SERVICE_DISCOVERY_TIMEOUT):
+        return await self._wait_for_service(service_name, detected_event)
+    except TimeoutError:
+      # Not found
+      return None
+    finally:
+      self._pending_services.pop(service_name, None)
 
   # returns controller in case the subscription suceeded, otherwise None
   async def subscribe_service(self, channel: str, service_name: str) -> ServiceController | None:
     async with self._subscription_lock:
-      if not self._tune_channel(channel):
+      if not await self._tune_channel(channel):
         return None
       return await self._subscribe_for_service_in_current_channel(service_name)
 
-  def _tune_channel(self, channel: str) -> bool:
+  async def _tune_channel(self, channel: str) -> bool:
     # first check, if there is a delayed channel reset pending
-    if self._channel_reset_task:
+    if self._channel_reset:
       # we have an active channel, check if we can reuse it
+      # we either reuse the channel or we reset it. In both cases: Cancel the delayed reset
+      self._channel_reset.cancel()
+      self._channel_reset = None
       if self._channel.name != channel:
         # no, we cant. reset channel immediately, so we can select a new one afterwards
-        self._reset_channel()
-      # we either reuse the channel or we resetted it. In both cases: Cancel the delayed reset
-      self._channel_reset_task.cancel()
-      self._channel_reset_task = None
+        await self._reset_channel()
 
     # If there is a channel active, check if its the correct one
     if self._channel.name:
@@ -142,11 +169,12 @@ class RadioController(ChannelEventHandler, ChannelEventPass):
     if not service_controller:
       # First time subscription to the service. Set up the controller and register it.
       service_controller = ServiceController()
-      self._services[service_id].controller = service_controller
       if not self._dab_device.subscribe_service(service_controller, service_id):
         self._cleanup_channel()
         logger.error('Subscription to selected service failed')
         return None
+      self._services[service_id].controller = service_controller
+      self._active_controllers += 1
 
     # increase the counter of active subscriptions for the selected service
     service_controller.subscribers += 1
@@ -154,18 +182,17 @@ class RadioController(ChannelEventHandler, ChannelEventPass):
     return service_controller
 
   def unsubscribe_service(self, service_name: str) -> None:
-    for service_id, service in self._services.items():
-      if service.name == service_name:
-        self._unsubscribe(service_id)
-        return
+    service_id = self._service_ids.get(service_name)
+    if service_id is not None:
+      self._unsubscribe(service_id)
 
   def get_service_controller(self, service_name: str) -> ServiceController | None:
-    for service in self._services.values():
-      if service.name == service_name:
-        # return controller. Might still be None
-        return service.controller
-    # not subscribed
-    return None
+    service_id = self._service_ids.get(service_name)
+    if service_id is None:
+      # not subscribed
+      return None
+    # return controller. Might still be None
+    return self._services[service_id].controller
 
   def _unsubscribe(self, service_id: int) -> None:
     service_controller = self._services[service_id].controller
@@ -178,40 +205,56 @@ class RadioController(ChannelEventHandler, ChannelEventPass):
       self._dab_device.unsubscribe_service(service_id)
       service_controller.release_waiters()
       self._services[service_id].controller = None
+      self._active_controllers -= 1
       self._cleanup_channel()
 
   def _cleanup_channel(self) -> None:
     # only reset when there is no service subscription
-    for service in self._services.values():
-      if service.controller:
-        return
-    # no subscription found
-    self._channel_reset_task = asyncio.get_running_loop().create_task(self._reset_channel_later())
-
-  async def _reset_channel_later(self) -> None:
-    await asyncio.sleep(RadioController.CHANNEL_RESET_DELAY)
-    # the reset job did not get cancelled. So do it now
-    self._reset_channel()
-    self._channel_reset_task = None
-
-  def _reset_channel(self) -> None:
-    assert not next((srv for srv in self._services.values() if srv.controller is not None), None)
-    self._dab_device.reset_channel()
-    self._channel.name = ''
-    self._services.clear()
-    self._dab_device.lock.release()
-
-  def stop(self) -> None:
+    if self._active_controllers == 0 and not self._channel_reset:
+      self._channel_reset = asyncio.get_running_loop().call_later(RadioController.CHANNEL_RESET_DELAY,
+                                                                  self._reset_channel_delayed)
+
+  def _reset_channel_delayed(self) -> None:
+    # the reset did not get cancelled. So do it now
+    self._channel_reset = None
+    self._reset_task = asyncio.create_task(self._run_delayed_reset())
+
+  async def _run_delayed_reset(self) -> None:
+    try:
+      # dont interfere with a subscription request in progress
+      async with self._subscription_lock:
+        # meanwhile, the channel might have been reused or its reset rescheduled
+        if self._active_controllers == 0 and not self._channel_reset and self._channel.name:
+          await self._reset_channel()
+    finally:
+      self._reset_task = None
+
+  async def _reset_channel(self) -> None:
+    assert self._active_controllers == 0
+    try:
+      await reset_channel(self._dab_device)
+    finally:
+      # the reset always completes, even if the awaiting request got cancelled
+      self._channel.name = ''
+      self._services.clear()
+      self._service_ids.clear()
+      self._dab_device.lock.release()
+
+  async def stop(self) -> None:
     active_sids = list(self._services.keys())
     for service_id in active_sids:
       self._unsubscribe(service_id)
+    # let a delayed reset in progress finish
+    if self._reset_task:
+      await self._reset_task
     # cancel a pending reset and reset immediately
-    if self._channel_reset_task:
-      self._reset_channel()
-      self._channel_reset_task.cancel()
-      self._channel_reset_task = None
+    if self._channel_reset:
+      self._channel_reset.cancel()
+      self._channel_reset = None
+      await self._reset_channel()
 
   def can_subscribe(self, new_channel: str) -> bool:
     return ((not self._channel.name) or            # either there is no active channel
             (self._channel.name == new_channel) or # OR target and current channel are the same
-            bool(self._channel_reset_task))            # OR a delayed reset is pending
+            bool(self._channel_reset) or           # OR a delayed reset is pending
+            bool(self._reset_task))                # OR a delayed reset is in progress
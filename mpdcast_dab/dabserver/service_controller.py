@@ -15,6 +15,7 @@
 """Class that receives data of one service and forwards it to the subscribers"""
 
 import asyncio
+import collections
 import logging
 import dataclasses
 import typing
@@ -53,7 +54,8 @@ class ServiceController(ServiceEventHandler, ServiceEventPass):
     BUFFER_SIZE = 10
     def __init__(self) -> None:
       self.next_frame  = 0
-      self.data        = [b''] * ServiceController.AudioBuffer.BUFFER_SIZE
+      # frames are memoryviews on the decoder output. b''.join copies them once for the readers
+      self.data: list[bytes | memoryview] = [b''] * ServiceController.AudioBuffer.BUFFER_SIZE
       self.data_lock   = asyncio.Lock()
 
   def __init__(self) -> None:
@@ -100,16 +102,30 @@ class ServiceController(ServiceEventHandler, ServiceEventPass):
     self._events.picture.set()
     self._events.label.set()
 
-  async def on_new_audio(self, audio_data: bytes, sample_rate: int, mode: str) -> None:
+  # must be called while holding the audio data lock
+  def _store_audio_frame(self, audio_data: memoryview, sample_rate: int, mode: str) -> None:
     self.data.sample_rate = sample_rate
     self.data.mode = mode
-    async with self._audio_buffer.data_lock:
-      self._audio_buffer.data[self._audio_buffer.next_frame] = audio_data
-      self._audio_buffer.next_frame = (self._audio_buffer.next_frame+1) % ServiceController.AudioBuffer.BUFFER_SIZE
+    self._audio_buffer.data[self._audio_buffer.next_frame] = audio_data
+    self._audio_buffer.next_frame = (self._audio_buffer.next_frame+1) % ServiceController.AudioBuffer.BUFFER_SIZE
+
+  def _notify_new_audio(self) -> None:
     if not self._delete_in_progress:
       self._events.audio.set()
       self._events.audio.clear()
 
+  async def on_new_audio(self, audio_data: memoryview, sample_rate: int, mode: str) -> None:
+    async with self._audio_buffer.data_lock:
+      self._store_audio_frame(audio_data, sample_rate, mode)
+    self._notify_new_audio()
+
+  async def on_new_audio_frames(self, audio_frames: collections.deque) -> None:
+    # store the whole batch at once, so the waiters get notified only once
+    async with self._audio_buffer.data_lock:
+      while audio_frames:
+        self._store_audio_frame(*audio_frames.popleft())
+    self._notify_new_audio()
+
   async def on_new_dynamic_label(self, label: str) -> None:
     self.data.label = label
     if not self._delete_in_progress:
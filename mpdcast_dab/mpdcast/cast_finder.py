@@ -21,30 +21,50 @@ import pychromecast
 
 class CastFinder(pychromecast.discovery.AbstractCastListener):
   def __init__(self, device_name: str) -> None:
-    self._device_name:          str                                = device_name
-    self._device:               uuid.UUID | None                   = None
-    self._browser:              pychromecast.discovery.CastBrowser = None
-    self._discovery_done_event: asyncio.Event                      = asyncio.Event()
+    self._device_name:          str                                       = device_name
+    self._device:               pychromecast.discovery.CastInfo | None    = None
+    self._browser:              pychromecast.discovery.CastBrowser | None = None
+    self._discovery_done_event: asyncio.Event                             = asyncio.Event()
+    self._loop:                 asyncio.AbstractEventLoop                 = asyncio.get_running_loop()
 
+  # The listener callbacks are called from the zeroconf threads
   def add_cast(self, uuid: uuid.UUID, _service: str) -> None:
-    if self._device_name == self._browser.services[uuid].friendly_name:
-      self._device = self._browser.services[uuid]
-      self._discovery_done_event.set()
+    assert self._browser
+    cast_info = self._browser.services[uuid]
+    if self._device_name == cast_info.friendly_name:
+      self._device = cast_info
+      self._loop.call_soon_threadsafe(self._discovery_done_event.set)
+    elif self._device and self._device.uuid == uuid:
+      # the device got renamed
+      self._device = None
 
   def remove_cast(self, uuid: uuid.UUID, _service: str, cast_info: pychromecast.discovery.CastInfo) -> None:
-    pass
+    if self._device and self._device.uuid == uuid:
+      self._device = None
 
-  def update_cast(self, uuid: uuid.UUID, _service: str) -> None:
-    pass
+  def update_cast(self, uuid: uuid.UUID, service: str) -> None:
+    # The browser replaces the cast info on updates. Besides changed host or port, this is
+    # also reported for a removed device reappearing, or a device renamed to our device name
+    self.add_cast(uuid, service)
 
-  async def find_device (self) -> uuid.UUID | None:
-    self._device = None
+  async def find_device (self) -> pychromecast.discovery.CastInfo | None:
     self._discovery_done_event.clear()
-    self._browser = pychromecast.discovery.CastBrowser(self, zeroconf.Zeroconf(), None)
-    self._browser.start_discovery()
+    if self._browser:
+      # The browser keeps running between searches. So the device might be known already
+      if self._device:
+        return self._device
+    else:
+      # the finder owns its zeroconf instance. It gets closed by stop_discovery
+      self._browser = pychromecast.discovery.CastBrowser(self, zeroconf.Zeroconf(), None)
+      self._browser.start_discovery()
     await self._discovery_done_event.wait()
-    self._browser.stop_discovery()
     return self._device
 
   def cancel(self) -> None:
     self._discovery_done_event.set()
+
+  def stop(self) -> None:
+    if self._browser:
+      self._browser.stop_discovery()
+      self._browser = None
+      self._device = None
@@ -15,7 +15,6 @@
 """MPD http server stream to google cast sync module."""
 
 import asyncio
-import re
 import logging
 import dataclasses
 from typing import TypedDict, NotRequired, List, Any
@@ -66,14 +65,28 @@ class MpdConfig():
 
   def load(self) -> None:
     logger.info('Loading config from %s', self._filename)
+    # top level settings need to precede all tables in toml
+    top_level_lines: list[str] = []
+    section_lines:   list[str] = []
+    current_lines = top_level_lines
     with open(self._filename, 'r', encoding='utf-8') as cfg_file:
-      config_string = cfg_file.read()
-      # convert curly brace groups to toml arrays
-      config_string = re.sub(r"\n([^\s#]*?)\s*{(.*?)}", r"\n[[\1]]\2\n", config_string, flags=re.S, count=0)
-      # separate key and value with equals sign
-      config_string = re.sub(r"^\s*(\w+)\s*(.*)$", r"\1 = \2", config_string, flags=re.M, count=0)
-      # now the config should adhere to toml spec.
-      self._config = tomllib.loads(config_string)
+      for line in cfg_file:
+        line = line.strip()
+        if not line or line.startswith('#'):
+          continue
+        structure = line.split('#', 1)[0].strip()
+        if structure.endswith('{'):
+          # convert curly brace groups to toml arrays
+          section_lines.append('[[' + structure[:-1].strip() + ']]')
+          current_lines = section_lines
+        elif structure == '}':
+          current_lines = top_level_lines
+        else:
+          # separate key and value with equals sign
+          key_value = line.split(None, 1)
+          current_lines.append(key_value[0] + ' = ' + (key_value[1] if len(key_value) > 1 else ''))
+    # now the config should adhere to toml spec.
+    self._config = tomllib.loads('\n'.join(top_level_lines + section_lines))
 
   def read(self) -> None:
     self.port = int(self._config.get("port", "6600"))
@@ -160,22 +173,26 @@ class MpdCaster(pychromecast.controllers.receiver.CastStatusListener,
     self._main_task = loop.create_task(self.run())
 
   async def run(self) -> None:
-    while True:
-      try:
-        cast_finder = CastFinder(self._mpd.config.device_name)
-        # wait until we find the cast device in the network
-        await self.waitfor_and_register_castdevice(cast_finder)
-      except asyncio.CancelledError:
-        cast_finder.cancel()
-        raise
-      try:
-        # run the cast (until chromecast or MPD disconnect)
-        await self.cast_until_connection_lost()
-      except asyncio.CancelledError:
-        self._mpd.client.stop()
-        self._mpd.client.disconnect()
-        self._handle_mpd_stop_play()
-        raise
+    # the finder and its discovery state are kept across reconnects to the cast device
+    cast_finder = CastFinder(self._mpd.config.device_name)
+    try:
+      while True:
+        try:
+          # wait until we find the cast device in the network
+          await self.waitfor_and_register_castdevice(cast_finder)
+        except asyncio.CancelledError:
+          cast_finder.cancel()
+          raise
+        try:
+          # run the cast (until chromecast or MPD disconnect)
+          await self.cast_until_connection_lost()
+        except asyncio.CancelledError:
+          self._mpd.client.stop()
+          self._mpd.client.disconnect()
+          self._handle_mpd_stop_play()
+          raise
+    finally:
+      cast_finder.stop()
 
   async def stop(self) -> None:
     if self._main_task is not None:
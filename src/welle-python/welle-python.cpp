@@ -16,6 +16,8 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include <unordered_set>
+
 #include "backend/radio-receiver.h"
 #include "input/input_factory.h"
 #include "various/channels.h"
@@ -24,8 +26,58 @@ namespace py = pybind11;
 
 #define RUN_IN_ASYNC(cname, name, ...)                                                        \
   py::gil_scoped_acquire gil;                                                                 \
-  py::function method = py::get_override(static_cast<const cname *>(this), name);             \
-  py::module_::import("asyncio").attr("run_coroutine_threadsafe")(method(__VA_ARGS__), loop);
+  py::function method = getHandler(static_cast<const cname *>(this), name);                   \
+  if (method)                                                                                 \
+    forward(method(__VA_ARGS__));
+
+// Holds the event loop and the submit function used to forward callbacks into asyncio.
+// Both are resolved once on construction instead of on every callback.
+class AsyncioForwarder {
+protected:
+  py::object loop;
+  py::object run_coroutine_threadsafe;
+  // Callbacks whose python handler does nothing. Only accessed while holding the GIL.
+  // The callback names are string literals, so they are keyed by address without any allocation.
+  std::unordered_set<const char*> skippedHandlers;
+
+  // Returns the python handler method, or an empty function if the callback does not need to be forwarded
+  template <class T>
+  py::function getHandler(const T* handler, const char* name)
+  {
+    if (skippedHandlers.count(name))
+      return py::function();
+
+    py::function method = py::get_override(handler, name);
+    if (!method || py::hasattr(method, "skip_forwarding"))
+    {
+      skippedHandlers.emplace(name);
+      return py::function();
+    }
+    return method;
+  }
+
+  // Coroutines get handed over to the event loop.
+  // Plain (non-async) handlers already completed on the calling DAB thread, while holding the GIL.
+  void forward(const py::object& result)
+  {
+    if (PyCoro_CheckExact(result.ptr()))
+      run_coroutine_threadsafe(result, loop);
+  }
+
+public:
+  AsyncioForwarder()
+  {
+    py::module_ asyncio = py::module_::import("asyncio");
+    loop = asyncio.attr("get_event_loop")();
+    run_coroutine_threadsafe = asyncio.attr("run_coroutine_threadsafe");
+  }
+};
+
+// Owns the samples of one decoded audio frame. They are exposed to python via the buffer protocol,
+// so the frame can be handed over without copying the samples.
+struct AudioFrame {
+  std::vector<int16_t> samples;
+};
 
 class ServiceEventHandler : public ProgrammeHandlerInterface {
 public:
@@ -39,25 +91,38 @@ public:
   virtual void ProcessUntouchedStream(const uint8_t* /*data*/, size_t /*len*/, size_t /*duration_ms*/) override {}
 };
 
-class PyServiceEventHandler: public ServiceEventHandler {
+class PyServiceEventHandler: public ServiceEventHandler, protected AsyncioForwarder {
 protected:
-  py::object loop;
+  // audio frames which are not yet processed by the event loop. Only accessed while holding the GIL.
+  py::object audioFrames;
+
+  // Audio frames are queued and handed over to the event loop in batches.
+  // A new batch is only submitted if the previous one got fully drained already.
+  void forwardAudio(const py::memoryview& data, int sampleRate, const std::string& mode)
+  {
+    bool drainPending = py::len(audioFrames) > 0;
+    audioFrames.attr("append")(py::make_tuple(data, sampleRate, mode));
+    if (!drainPending)
+    {
+      RUN_IN_ASYNC(ServiceEventHandler, "on_new_audio_frames", audioFrames);
+    }
+  }
 
 public:
-  PyServiceEventHandler(): loop(py::module_::import("asyncio").attr("get_event_loop")())  {}
+  PyServiceEventHandler(): audioFrames(py::module_::import("collections").attr("deque")()) {}
 
   virtual void ProcessUntouchedStream(const uint8_t* audioData, size_t len, size_t duration_ms) override 
   {
     py::gil_scoped_acquire acquire;
-    py::bytes data((const char*)audioData, len);
-    RUN_IN_ASYNC(ServiceEventHandler, "on_new_audio", data, 0, "aac");    
+    py::memoryview data(py::bytes((const char*)audioData, len));
+    forwardAudio(data, 0, "aac");
   }
 
   virtual void onNewAudio(std::vector<int16_t>&& audioData, int sampleRate, const std::string& mode) override
   {
     py::gil_scoped_acquire acquire;
-    py::bytes data((const char*)audioData.data(), 2*audioData.size());
-    RUN_IN_ASYNC(ServiceEventHandler, "on_new_audio", data, sampleRate, mode);
+    py::memoryview data(py::cast(AudioFrame{std::move(audioData)}));
+    forwardAudio(data, sampleRate, mode);
   }
 
   virtual void onNewDynamicLabel(const std::string& label) override
@@ -117,13 +182,8 @@ public:
 };
 
 class ChannelEventHandler : public NullRadioController {};
-class PyChannelEventHandler : public ChannelEventHandler {
-protected:
-  py::object loop;
-
+class PyChannelEventHandler : public ChannelEventHandler, protected AsyncioForwarder {
 public:
-  PyChannelEventHandler(): loop(py::module_::import("asyncio").attr("get_event_loop")())  {}
-
   virtual void onSyncChange(char isSync) override 
   { 
     bool syncBool = (bool) isSync;
@@ -328,6 +388,12 @@ std::list<std::string> all_channel_names ()
 
 PYBIND11_MODULE(welle_io, m) 
 {
+  py::class_<AudioFrame>(m, "AudioFrame", py::buffer_protocol())
+     .def_buffer([](AudioFrame& frame) -> py::buffer_info {
+        return py::buffer_info(frame.samples.data(), 1, py::format_descriptor<uint8_t>::format(),
+                               sizeof(int16_t) * frame.samples.size(), true);
+      });
+
   py::class_<ServiceEventHandler, PyServiceEventHandler>(m, "ServiceEventHandler")
      .def(py::init<>());
 